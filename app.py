@@ -1,7 +1,8 @@
 import streamlit as st
 from streamlit_feedback import streamlit_feedback
+import numpy as np
 import pandas as pd
-from match import InvestorMatcher
+from match import InvestorMatcher, weighted_scores
 import matplotlib
 import plotly.graph_objects as go
 import plotly.express as px
@@ -20,6 +21,7 @@ import plotly.express as px
 
 3. Matching System:
    - Two search modes: Investor-based and Startup-based
+   - Startup-based search ranks the top investors for one startup directly
    - Filtering by values (Growth, ROI, Stage) or attributes (Domain, Fund, Risk)
    - Original and feedback-adjusted scoring
 """
@@ -51,6 +53,14 @@ calculate_feedback_adjustment():
 - Computes score adjustments based on user feedback
 - Converts ratings to percentage-based adjustments
 - Handles missing feedback gracefully
+
+bubble_score_table():
+- Builds the investors x startups Match_Score table from the score matrices
+
+sample_bubble_points():
+- Drops pairs below the selected score threshold
+- Uniformly samples the rest down to the point budget
+- Builds rows only for the kept pairs and returns the true totals for the caption
 """
 
 # Main Function Structure:
@@ -64,13 +74,15 @@ calculate_feedback_adjustment():
 2. Tab 2 - Visualization:
    - Visualization type selection
    - Data preparation for each chart type
+   - Radar Chart scores only the selected pair (score_breakdown)
+   - Bubble Chart filters by score and samples to a point budget before rendering with WebGL
    - Chart rendering with Plotly
    - Dynamic interpretation display
 """
 
 # Data Flow:
 """
-1. User Input → Matcher → Results
+1. User Input → Matcher (warm-started from .matcher_snapshot) → Results
 2. Results → Visualization → Charts
 3. Charts → Interpretation → Insights
 4. User Feedback → Storage → Score Adjustment
@@ -143,18 +155,19 @@ def provide_dynamic_interpretation(viz_type, data, selected_data=None):
         """
 
     elif viz_type == "Bubble Chart":
-        # Analyze distribution
-        excellent = len(data[data['Match_Score'] >= 90])
-        good = len(data[data['Match_Score'].between(70, 90)])
-        avg_score = data['Match_Score'].mean()
+        # Analyze distribution over the investors x startups score table, pairs below threshold are NaN
+        scores = data.to_numpy()
+        excellent = int((scores >= 90).sum())
+        good = int(((scores >= 70) & (scores <= 90)).sum())
+        avg_score = np.nanmean(scores)
 
         interpretation = f"""
         💫 Bubble Chart Analysis:
         • {excellent} excellent matches (90%+ compatibility)
         • {good} good matches (70-90% compatibility)
         • Market average match score: {avg_score:.1f}%
-        • Most active investor: {data.groupby('Investor').size().idxmax()}
-        • Most sought-after startup: {data.groupby('Startup').size().idxmax()}
+        • Most active investor: {data.count(axis=1).idxmax()}
+        • Most sought-after startup: {data.count(axis=0).idxmax()}
         """
 
     return interpretation
@@ -199,6 +212,39 @@ def calculate_feedback_adjustment(investor, startup):
     return 0
 
 
+def bubble_score_table(matcher):
+    """
+    Match_Score (mean of the weighted components) for every pair, as an investors x startups table
+    built from the precomputed score matrices
+    """
+    scores = matcher.component_scores()
+    components = weighted_scores(*(scores[name] for name in matcher.score_components), matcher.weights)[:4]
+    return pd.DataFrame(
+        sum(components) / len(components),
+        index=matcher.investors['Investor_Group_Name'],
+        columns=matcher.startups['Company_Name']
+    )
+
+
+def sample_bubble_points(score_table, threshold, point_budget, seed=0):
+    """
+    Reduce the score table to the pairs above threshold, sampled down to point_budget.
+    Only the kept pairs are turned into rows. Returns the points to plot and the number
+    of pairs above the threshold.
+    """
+    scores = score_table.to_numpy().ravel()
+    kept = np.flatnonzero(scores >= threshold)
+    above_threshold = len(kept)
+    if above_threshold > point_budget:
+        kept = np.sort(np.random.default_rng(seed).choice(kept, size=point_budget, replace=False))
+    investor_idx, startup_idx = np.divmod(kept, score_table.shape[1])
+    return pd.DataFrame({
+        'Investor': score_table.index.to_numpy()[investor_idx],
+        'Startup': score_table.columns.to_numpy()[startup_idx],
+        'Match_Score': scores[kept]
+    }), above_threshold
+
+
 def main():
     st.title("Investor-Startup Matching Platform")
     tab1, tab2 = st.tabs(["Matching", "Visualization"])
@@ -212,7 +258,8 @@ def main():
         # Initialize matcher
         matcher = InvestorMatcher(
             investors_file="investors.csv",
-            startups_file="startups.csv"
+            startups_file="startups.csv",
+            snapshot_dir=".matcher_snapshot"
         )
 
         # Create selection options from actual data
@@ -358,23 +405,49 @@ def main():
                 "Select Startups",
                 startup_names
             )
+            # Optional investor prefilters, empty selection keeps all investors
+            investor_domains = st.multiselect(
+                "Investor Domain",
+                sorted(matcher.investors['Domain'].dropna().unique())
+            )
+            risk_appetites = st.multiselect(
+                "Investor Risk Appetite",
+                sorted(matcher.investors['Risk_Appetite'].dropna().unique())
+            )
+            min_fund_score = st.selectbox(
+                "Minimum fund match score",
+                [0, 25, 40, 50, 60, 80, 100],
+                format_func=lambda score: "Any" if score == 0 else str(score)
+            )
+            # number_input, unlike slider, accepts min_value == max_value for a single investor
+            top_k = st.number_input(
+                "Number of matches",
+                min_value=1,
+                max_value=max(len(investor_names), 1),
+                value=min(10, max(len(investor_names), 1))
+            )
             if st.button("Find Matches"):
-                results = matcher.find_matches()
-                startup_matches = results[results['Startup'] == selected_startup].sort_values(by='Score',ascending=False)
+                startup_matches = matcher.find_matches_for_startup(
+                    selected_startup,
+                    top_k=int(top_k),
+                    domains=investor_domains,
+                    risk_appetites=risk_appetites,
+                    min_fund_score=min_fund_score
+                )
 
                 st.subheader(f"Matches for {selected_startup}")
                 st.dataframe(startup_matches)
     with tab2:
         st.header("Investor-Startup Match Visualization")
-        matcher.find_matches()
-        # Get the toVisualize dataframe from the InvestorMatcher class
-        df_to_visualize = matcher.toVisualize
         
         # Dropdown for selecting visualization type
         viz_type = st.selectbox("Select Visualization Type", ["Heatmap", "Radar Chart", "Bubble Chart"])
         
         if viz_type == "Heatmap":
             st.subheader("Investor-Startup Match Heatmap")
+            matcher.find_matches()
+            # Get the toVisualize dataframe from the InvestorMatcher class
+            df_to_visualize = matcher.toVisualize
             
             # Calculate overall match score
             df_to_visualize['Match_Score'] = df_to_visualize[['Domain', 'Sector', 'Fund', 'Risk']].mean(axis=1)
@@ -396,17 +469,12 @@ def main():
         elif viz_type == "Radar Chart":
             st.subheader("Investor-Startup Match Radar Chart")
             
-            investors = df_to_visualize['Investor'].unique()
-            startups = df_to_visualize['Startup'].unique()
-            
-            selected_investor = st.selectbox("Select Investor", investors)
-            selected_startup = st.selectbox("Select Startup", startups)
+            selected_investor = st.selectbox("Select Investor", investor_names)
+            selected_startup = st.selectbox("Select Startup", startup_names)
             
-            # Get match scores for selected investor and startup
-            match_scores = df_to_visualize[
-                (df_to_visualize['Investor'] == selected_investor) & 
-                (df_to_visualize['Startup'] == selected_startup)
-            ][['Domain', 'Sector', 'Fund', 'Risk']].iloc[0]
+            # Score only the selected pair instead of running the full matching
+            selected_data = pd.Series(matcher.score_breakdown(selected_investor, selected_startup))
+            match_scores = selected_data[['Domain', 'Sector', 'Fund', 'Risk']].astype(float)
             
             # Create radar chart using Plotly
             categories = list(match_scores.index)
@@ -429,28 +497,48 @@ def main():
             )
             
             st.plotly_chart(fig)
-            selected_data = df_to_visualize[
-                (df_to_visualize['Investor'] == selected_investor) &
-                (df_to_visualize['Startup'] == selected_startup)
-                ].iloc[0]
-            interpretation = provide_dynamic_interpretation(viz_type, df_to_visualize, selected_data)
+            st.markdown(
+                f"**Total score:** {selected_data['Score']:.1f} ({selected_data['Compatibility']})  \n"
+                f"**Sector:** {selected_data['Startup_Sector']} vs portfolio entry "
+                f"{selected_data['Best_Portfolio_Match'] or 'none'}  \n"
+                f"**Fund:** {selected_data['Fund_Ratio']:.2f}x the deal size (tier {selected_data['Fund_Tier']})  \n"
+                f"**Risk:** {selected_data['Risk_Appetite']} appetite vs {selected_data['Risk_Assessment']} "
+                f"assessment (tier {selected_data['Risk_Tier']})"
+            )
+            interpretation = provide_dynamic_interpretation(viz_type, None, match_scores)
             display_beautiful_interpretation(interpretation)
 
         elif viz_type == "Bubble Chart":
             st.subheader("Investor-Startup Match Bubble Chart")
             
-            # Calculate overall match score
-            df_to_visualize['Match_Score'] = df_to_visualize[['Domain', 'Sector', 'Fund', 'Risk']].mean(axis=1)
+            # Calculate overall match score straight from the score matrices, without a row per pair
+            score_table = bubble_score_table(matcher)
+            
+            # Level of detail: drop low scores and cap the number of points sent to the browser
+            col1, col2 = st.columns(2)
+            with col1:
+                # Match_Score averages the weighted components, so bound the slider by the data
+                max_match_score = max(float(score_table.to_numpy().max(initial=0)), 1.0)
+                threshold = st.slider("Minimum match score", 0.0, max_match_score, 0.0, step=0.5)
+            with col2:
+                point_budget = st.number_input("Maximum points", min_value=100, value=5000, step=500)
+            bubble_data, above_threshold = sample_bubble_points(score_table, threshold, int(point_budget))
+            st.caption(
+                f"Showing {len(bubble_data):,} of {above_threshold:,} pairs scoring at least {threshold:.1f} "
+                f"({score_table.size:,} pairs in total)"
+                + (", randomly sampled" if len(bubble_data) < above_threshold else "")
+            )
             
-            # Create bubble chart using Plotly
-            fig = px.scatter(df_to_visualize, 
+            # Create bubble chart using Plotly, rendered with WebGL
+            fig = px.scatter(bubble_data, 
                             x="Investor", 
                             y="Startup", 
                             size="Match_Score", 
                             color="Match_Score",
                             hover_name="Startup", 
                             size_max=60,
-                            color_continuous_scale="YlOrRd")
+                            color_continuous_scale="YlOrRd",
+                            render_mode="webgl")
             
             fig.update_layout(
                 xaxis_title="Investors",
@@ -459,7 +547,7 @@ def main():
             )
             
             st.plotly_chart(fig)
-            interpretation = provide_dynamic_interpretation(viz_type, df_to_visualize)
+            interpretation = provide_dynamic_interpretation(viz_type, score_table.where(score_table >= threshold))
             display_beautiful_interpretation(interpretation)
 
 if __name__ == "__main__":
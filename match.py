@@ -1,5 +1,12 @@
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 """
 InvestorMatcher Class Structure:
@@ -43,7 +50,8 @@ InvestorMatcher Class Structure:
 
 5. Match Score Calculation (calculate_match_score):
    - Combines all scoring components with weights
-   - Tracks scores for visualization
+   - Reference scorer for a single pair; find_matches scores whole blocks of
+     pairs from the precomputed component score matrices instead
    - Components:
      * Domain alignment
      * Sector fit
@@ -60,6 +68,28 @@ InvestorMatcher Class Structure:
      * Medium: ≥ 52.5%
      * Low: < 52.5%
 
+7. Warm-start Snapshot (save_snapshot / load_snapshot):
+   - Precomputes encodings once per dataset (build_encodings):
+     * Sector vocabulary with sparse token counts for portfolio entries and sectors
+     * Factorized Domain and Risk columns, fund and deal amounts
+   - Optionally stores the component score matrices (component_scores)
+   - Saved as one .npy file per array plus a versioned manifest.json
+   - Arrays are memory-mapped on load
+   - Rebuilt automatically when the CSV content hashes no longer match
+
+8. Startup-centric Query (find_matches_for_startup):
+   - Scores one startup against all investors and returns a ranked top-K
+   - Prefilters investors through indexes (build_investor_index):
+     * Positions by Domain and Risk_Appetite
+     * Fund_Available sorted for range lookups of the fund tiers
+   - Cost scales with the number of investors only
+
+9. Pair Score Breakdown (score_breakdown):
+   - Looks up one investor/startup pair by name in O(1)
+   - Reads the precomputed scores and best portfolio entry when the score matrices are loaded
+   - Returns the weighted component scores and total score
+   - Includes the inputs behind them (best portfolio entry, fund ratio and tier, risk levels)
+
 Key Features:
 - Comprehensive scoring system
 - Flexible filtering options
@@ -69,9 +99,130 @@ Key Features:
 """
 
 
+SNAPSHOT_VERSION = 4
+SNAPSHOT_MANIFEST = "manifest.json"
+# Mode a plain open() would create files with; the umask can only be read by setting it,
+# so this is done once at import rather than while other threads may be writing
+_umask = os.umask(0)
+os.umask(_umask)
+SNAPSHOT_FILE_MODE = 0o666 & ~_umask
+# Compact dtypes of the score matrices: tiers are small integers, sector scores need ~7 digits
+TIER_DTYPE = np.uint8
+SECTOR_SCORE_DTYPE = np.float32
+# Position of the best matching entry within an investor's portfolio, -1 when nothing matches
+PORTFOLIO_ENTRY_DTYPE = np.int16
+
+
+def file_sha256(path):
+    """
+    Content hash of a data file, used to detect stale snapshots
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_atomically(path, write):
+    """
+    Write a file through a unique temporary file in the same directory and rename it into place,
+    so concurrent writers never clash and readers never see a half-written file
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        # mkstemp creates owner-only files, give the snapshot the usual umask-based permissions
+        os.chmod(temp_path, SNAPSHOT_FILE_MODE)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def sector_similarity(portfolio_counts, sector_counts):
+    """
+    Cosine similarity of every sector against every portfolio entry of one investor.
+    TF-IDF is weighted per investor/startup pair, exactly like the TfidfVectorizer
+    fitted in calculate_match_score. Both inputs are sparse token count matrices.
+    Returns an array of shape (sectors, entries).
+    """
+    # Only tokens of the portfolio can contribute to the dot product
+    tokens = np.unique(portfolio_counts.indices)
+    entry_counts = portfolio_counts[:, tokens].toarray()
+    sector_token_counts = sector_counts[:, tokens].toarray()
+
+    n_docs = entry_counts.shape[0] + 1
+    doc_freq = (entry_counts > 0).sum(axis=0) + (sector_token_counts > 0)
+    idf = np.log((1 + n_docs) / (1 + doc_freq)) + 1
+    # Tokens outside the portfolio occur in the sector document only
+    sector_only_idf = np.log((1 + n_docs) / 2) + 1
+
+    sector_squares = np.asarray(sector_counts.multiply(sector_counts).sum(axis=1)).ravel()
+    sector_norms = np.sqrt(
+        (sector_squares - (sector_token_counts ** 2).sum(axis=1)) * sector_only_idf ** 2
+        + ((sector_token_counts * idf) ** 2).sum(axis=1)
+    )
+    entry_norms = np.sqrt((idf ** 2) @ (entry_counts ** 2).T)
+
+    dots = (sector_token_counts * idf ** 2) @ entry_counts.T
+    norms = entry_norms * sector_norms[:, None]
+    return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+
+def weighted_scores(domain, sector, fund, risk, weights):
+    """
+    Weight arrays of component scores like calculate_match_score.
+    Returns the weighted domain, sector, fund and risk scores and their total.
+    """
+    domain_score = np.where(domain, weights['domain_match'], 0)
+    sector_score = np.asarray(sector, dtype=float)
+    fund_score = (weights['fund_match'] * np.asarray(fund, dtype=float)) / 100
+    risk_score = (weights['risk_match'] * np.asarray(risk, dtype=float)) / 100
+    return domain_score, sector_score, fund_score, risk_score, domain_score + sector_score + fund_score + risk_score
+
+
+def fund_match_scores(investor_funds, startup_deals):
+    """
+    Vectorized calculate_fund_match_score over broadcastable arrays of funds and deals
+    """
+    covered = investor_funds >= startup_deals
+    return np.select(
+        [
+            covered & (investor_funds <= startup_deals * 1.5),
+            covered & (investor_funds <= startup_deals * 2),
+            covered & (investor_funds <= startup_deals * 3),
+            covered,
+            investor_funds >= startup_deals * 0.75,
+            investor_funds >= startup_deals * 0.5,
+        ],
+        [100, 80, 60, 40, 50, 25],
+        default=0
+    )
+
+
 class InvestorMatcher:
-    def __init__(self, investors_file, startups_file):
+    # Numeric arrays stored as memory-mappable .npy files in a snapshot
+    snapshot_arrays = [
+        "portfolio_offsets", "investor_domain", "startup_domain", "investor_risk", "startup_risk",
+        "fund_available", "deal"
+    ]
+    # Sparse token count matrices, stored as their CSR data/indices/indptr arrays
+    snapshot_sparse = ["portfolio_counts", "sector_counts"]
+    # Label lists stored in the snapshot manifest
+    snapshot_labels = ["sector_vocabulary", "portfolio_entries", "domain_categories", "risk_categories"]
+    score_components = ["domain", "sector", "fund", "risk"]
+    # Score matrices: the components plus the best matching portfolio entry behind the sector score
+    score_matrices = score_components + ["sector_entry"]
+
+    def __init__(self, investors_file, startups_file, snapshot_dir=None, snapshot_scores=True):
 
+        self.investors_file = investors_file
+        self.startups_file = startups_file
         self.investors = pd.read_csv(investors_file)
         self.startups = pd.read_csv(startups_file)
         self.weights = {
@@ -83,6 +234,240 @@ class InvestorMatcher:
         self.match_threshold = 70
         self.toVisualize = pd.DataFrame()
 
+        # Derived state: encodings are always present, score matrices are built on demand
+        self.encoded = None
+        self.scores = None
+        self.source_hashes = None
+        self.investor_index = None
+        # Name -> row position maps for single investor/startup lookups
+        self.investor_positions = {}
+        for position, name in enumerate(self.investors['Investor_Group_Name']):
+            self.investor_positions.setdefault(name, position)
+        self.startup_positions = {}
+        for position, name in enumerate(self.startups['Company_Name']):
+            self.startup_positions.setdefault(name, position)
+        # Raw column values shown by score_breakdown, as arrays for positional lookups
+        self.investor_columns = {column: self.investors[column].to_numpy()
+                                 for column in ['Domain', 'Fund_Available', 'Risk_Appetite']}
+        self.startup_columns = {column: self.startups[column].to_numpy()
+                                for column in ['Domain', 'Deal', 'Risk_Assessment', 'Sector']}
+        if snapshot_dir is not None:
+            self.load_snapshot(snapshot_dir)
+        if self.encoded is None:
+            self.encoded = self.build_encodings()
+            if snapshot_dir is not None:
+                # The snapshot is only a cache, failing to write it must not break the matcher
+                try:
+                    self.save_snapshot(snapshot_dir, include_scores=snapshot_scores)
+                except OSError:
+                    pass
+
+    def build_encodings(self):
+        """
+        Encode the columns used for scoring: sector token counts, categorical codes and amounts
+        """
+        portfolio_entries = []
+        portfolio_offsets = [0]
+        for portfolio in self.investors['Past_Portfolio']:
+            portfolio_entries.extend(portfolio.split(','))
+            portfolio_offsets.append(len(portfolio_entries))
+        sectors = self.startups['Sector'].tolist()
+
+        # Same tokenizer as the TfidfVectorizer in calculate_match_score
+        counter = CountVectorizer()
+        counter.fit(portfolio_entries + sectors)
+
+        domains, domain_categories = pd.factorize(
+            pd.concat([self.investors['Domain'], self.startups['Domain']], ignore_index=True))
+        risks, risk_categories = pd.factorize(
+            pd.concat([self.investors['Risk_Appetite'], self.startups['Risk_Assessment']], ignore_index=True))
+        n_investors = len(self.investors)
+
+        return {
+            "sector_vocabulary": counter.get_feature_names_out().tolist(),
+            "portfolio_entries": portfolio_entries,
+            "portfolio_counts": sparse.csr_matrix(counter.transform(portfolio_entries), dtype=float),
+            "portfolio_offsets": np.array(portfolio_offsets),
+            "sector_counts": sparse.csr_matrix(counter.transform(sectors), dtype=float),
+            "domain_categories": domain_categories.tolist(),
+            "investor_domain": domains[:n_investors],
+            "startup_domain": domains[n_investors:],
+            "risk_categories": risk_categories.tolist(),
+            "investor_risk": risks[:n_investors],
+            "startup_risk": risks[n_investors:],
+            "fund_available": self.investors['Fund_Available'].to_numpy(dtype=float),
+            "deal": self.startups['Deal'].to_numpy(dtype=float)
+        }
+
+    def data_hashes(self):
+        """
+        Content hashes of the investor and startup CSV files
+        """
+        if self.source_hashes is None:
+            self.source_hashes = {
+                "investors": file_sha256(self.investors_file),
+                "startups": file_sha256(self.startups_file)
+            }
+        return self.source_hashes
+
+    def investor_portfolio_counts(self, investor_idx):
+        """
+        Token counts of the portfolio entries of one investor
+        """
+        offsets = self.encoded['portfolio_offsets']
+        return self.encoded['portfolio_counts'][offsets[investor_idx]:offsets[investor_idx + 1]]
+
+    def risk_score_table(self):
+        """
+        Risk_appetite_score for every pair of risk codes. The trailing row/column stands for
+        missing values and scores 0, like NaN compared with anything in Risk_appetite_score.
+        """
+        categories = self.encoded['risk_categories']
+        table = np.array([
+            [self.Risk_appetite_score({'Risk_Appetite': appetite}, {'Risk_Assessment': assessment})
+             for assessment in categories]
+            for appetite in categories
+        ], dtype=int).reshape(len(categories), len(categories))
+        return np.pad(table, (0, 1))
+
+    def component_scores(self):
+        """
+        Unweighted component scores for every investor/startup pair, as investors x startups matrices.
+        Fund and risk tiers are stored as TIER_DTYPE and sector scores as SECTOR_SCORE_DTYPE.
+        """
+        if self.scores is not None:
+            return self.scores
+        encoded = self.encoded
+        investor_domain = encoded['investor_domain'][:, None]
+        startup_domain = encoded['startup_domain'][None, :]
+
+        sector = np.zeros((len(self.investors), len(self.startups)), dtype=SECTOR_SCORE_DTYPE)
+        sector_entry = np.full((len(self.investors), len(self.startups)), -1, dtype=PORTFOLIO_ENTRY_DTYPE)
+        for i in range(len(self.investors)):
+            similarity = sector_similarity(self.investor_portfolio_counts(i), encoded['sector_counts'])
+            sector[i] = similarity.max(axis=1) * 100
+            sector_entry[i] = np.where(similarity.max(axis=1) > 0, similarity.argmax(axis=1), -1)
+
+        # Factorize marks missing values with -1, which indexes the table's trailing "missing" slot
+        risk_table = self.risk_score_table()
+
+        self.scores = {
+            "domain": (investor_domain == startup_domain) & (investor_domain >= 0),
+            "sector": sector,
+            "sector_entry": sector_entry,
+            "fund": fund_match_scores(
+                encoded['fund_available'][:, None], encoded['deal'][None, :]).astype(TIER_DTYPE),
+            "risk": risk_table[encoded['investor_risk'][:, None], encoded['startup_risk'][None, :]].astype(TIER_DTYPE)
+        }
+        return self.scores
+
+    def save_snapshot(self, snapshot_dir, include_scores=True):
+        """
+        Save the encodings (and optionally the component score matrices) to snapshot_dir
+        """
+        os.makedirs(snapshot_dir, exist_ok=True)
+        arrays = {name: self.encoded[name] for name in self.snapshot_arrays}
+        for name in self.snapshot_sparse:
+            arrays[f"{name}_data"] = self.encoded[name].data
+            arrays[f"{name}_indices"] = self.encoded[name].indices
+            arrays[f"{name}_indptr"] = self.encoded[name].indptr
+        if include_scores:
+            for name, matrix in self.component_scores().items():
+                arrays[f"score_{name}"] = matrix
+
+        for name, array in arrays.items():
+            write_atomically(
+                os.path.join(snapshot_dir, f"{name}.npy"),
+                lambda f, array=array: np.save(f, np.ascontiguousarray(array))
+            )
+
+        manifest = {
+            "version": SNAPSHOT_VERSION,
+            "sources": self.data_hashes(),
+            "arrays": sorted(arrays),
+            "labels": {name: self.encoded[name] for name in self.snapshot_labels}
+        }
+        write_atomically(
+            os.path.join(snapshot_dir, SNAPSHOT_MANIFEST),
+            lambda f: f.write(json.dumps(manifest).encode())
+        )
+
+    def load_snapshot(self, snapshot_dir):
+        """
+        Memory-map a snapshot from snapshot_dir. Returns False if it is missing, outdated or stale.
+        """
+        try:
+            with open(os.path.join(snapshot_dir, SNAPSHOT_MANIFEST)) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if manifest.get("version") != SNAPSHOT_VERSION or manifest.get("sources") != self.data_hashes():
+            return False
+        labels = manifest.get("labels", {})
+        if any(name not in labels for name in self.snapshot_labels):
+            return False
+
+        try:
+            arrays = {
+                name: np.load(os.path.join(snapshot_dir, f"{name}.npy"), mmap_mode='r')
+                for name in manifest["arrays"]
+            }
+        except (OSError, ValueError):
+            return False
+        sparse_parts = [f"{name}_{part}" for name in self.snapshot_sparse for part in ("data", "indices", "indptr")]
+        if any(name not in arrays for name in self.snapshot_arrays + sparse_parts):
+            return False
+        if not self.snapshot_shapes_match(arrays, labels):
+            return False
+
+        self.encoded = {name: arrays[name] for name in self.snapshot_arrays}
+        self.encoded.update(labels)
+        n_tokens = len(labels["sector_vocabulary"])
+        for name in self.snapshot_sparse:
+            indptr = arrays[f"{name}_indptr"]
+            self.encoded[name] = sparse.csr_matrix(
+                (arrays[f"{name}_data"], arrays[f"{name}_indices"], indptr),
+                shape=(len(indptr) - 1, n_tokens)
+            )
+        if all(f"score_{name}" in arrays for name in self.score_matrices):
+            self.scores = {name: arrays[f"score_{name}"] for name in self.score_matrices}
+        return True
+
+    def snapshot_shapes_match(self, arrays, labels):
+        """
+        Check that snapshot arrays line up with the loaded CSVs and with each other,
+        so a partially written or hand-copied snapshot is rebuilt instead of misaligning scores
+        """
+        n_investors = len(self.investors)
+        n_startups = len(self.startups)
+        expected_shapes = {
+            "investor_domain": (n_investors,),
+            "investor_risk": (n_investors,),
+            "fund_available": (n_investors,),
+            "portfolio_offsets": (n_investors + 1,),
+            "startup_domain": (n_startups,),
+            "startup_risk": (n_startups,),
+            "deal": (n_startups,),
+            "portfolio_counts_indptr": (len(labels["portfolio_entries"]) + 1,),
+            "sector_counts_indptr": (n_startups + 1,)
+        }
+        expected_shapes.update({f"score_{name}": (n_investors, n_startups)
+                                for name in self.score_matrices if f"score_{name}" in arrays})
+        if any(arrays[name].shape != shape for name, shape in expected_shapes.items()):
+            return False
+
+        offsets = arrays["portfolio_offsets"]
+        if offsets[0] != 0 or offsets[-1] != len(labels["portfolio_entries"]):
+            return False
+        for name in self.snapshot_sparse:
+            indices = arrays[f"{name}_indices"]
+            n_values = arrays[f"{name}_indptr"][-1]
+            if len(indices) != n_values or len(arrays[f"{name}_data"]) != n_values:
+                return False
+            if n_values and indices.max() >= len(labels["sector_vocabulary"]):
+                return False
+        return True
+
     def calculate_fund_match_score(self,investor_funds, startup_deal):
         """
         Calculate a fund match score out of 100 based on how close the available funds are to the deal size
@@ -159,6 +544,7 @@ class InvestorMatcher:
     def calculate_match_score(self,investor, startup, weights):
         """
         Calculate a match score between an investor and a startup based on weights.
+        Kept as the reference scorer that precomputed_match_score is checked against.
         """
         score = 0
         domain_score=0
@@ -190,72 +576,276 @@ class InvestorMatcher:
         # Risk appetite match
         risk_score = (weights['risk_match'] * self.Risk_appetite_score(investor, startup))/100
         score += risk_score
-        # Update visualization DataFrame using concat instead of append
-        new_row = pd.DataFrame({
-            'Investor': [investor.get('Investor_Group_Name', 'Unknown')],
-            'Startup': [startup.get('Company_Name', 'Unknown')],
-            'Domain': [domain_score],
-            'Sector': [sector_score],
-            'Fund': [fund_score],
-            'Risk': [risk_score]
-        })
-        self.toVisualize = pd.concat([self.toVisualize, new_row], ignore_index=True)
 
         return score
 
 
+    def precomputed_match_score(self, investor_idx, startup_idx, weights):
+        """
+        Same result as calculate_match_score, looked up from the precomputed component scores.
+        Returns the total score and the weighted (domain, sector, fund, risk) components.
+        """
+        scores = self.component_scores()
+        domain_score = weights['domain_match'] if scores['domain'][investor_idx, startup_idx] else 0
+        sector_score = float(scores['sector'][investor_idx, startup_idx])
+        fund_score = (weights['fund_match'] * int(scores['fund'][investor_idx, startup_idx])) / 100
+        risk_score = (weights['risk_match'] * int(scores['risk'][investor_idx, startup_idx])) / 100
+        score = domain_score + sector_score + fund_score + risk_score
+        return score, (domain_score, sector_score, fund_score, risk_score)
+
+    def compatibility_level(self, score):
+        """
+        Map a match score to its compatibility level
+        """
+        return (
+            "High Compatibility"
+            if score >= self.match_threshold
+            else "Medium Compatibility"
+            if score >= self.match_threshold * 0.75
+            else "Low Compatibility"
+        )
+
+    def compatibility_levels(self, scores):
+        """
+        Vectorized compatibility_level over an array of match scores
+        """
+        return np.where(
+            scores >= self.match_threshold,
+            "High Compatibility",
+            np.where(scores >= self.match_threshold * 0.75, "Medium Compatibility", "Low Compatibility")
+        )
+
     def find_matches(self, value_criteria=None, attribute_criteria=None):
         """
         Find matches between investors and startups based on a scoring system.
         """
-        matches = []
-
-        for _, investor in self.investors.iterrows():
-            filtered_startups = self.startups
-            if value_criteria is not None:
-                for key, value in value_criteria.items():
-                    # do only if the value is not empty
-                    if value:
-                        if key == 'Growth Potential':
-                            if value == 'High':
-                                filtered_startups = filtered_startups[filtered_startups['Growth_Potential'] == 'High']
-                            elif value == 'Medium':
-                                filtered_startups = filtered_startups[filtered_startups['Growth_Potential'] == 'Medium']
-                            elif value == 'Low':
-                                filtered_startups = filtered_startups[filtered_startups['Growth_Potential'] == 'Low']
-                        elif key == 'ROI':
-                            filtered_startups = filtered_startups[filtered_startups['ROI'] >= float(value)]
-                        elif key == 'Investment Stage':
-                            filtered_startups = filtered_startups[filtered_startups['Investment_Stage'] == value]
-
-            for _, startup in filtered_startups.iterrows():
-                altered_weights = self.weights
-                if attribute_criteria :
-                    if 'Domain' in attribute_criteria:
-                        altered_weights['domain_match'] = 100/len(attribute_criteria)
-                    else:
-                        altered_weights['domain_match'] = 0
-                    if 'Fund Availability' in attribute_criteria:
-                        altered_weights['fund_match'] = 100/len(attribute_criteria)
-                    else:
-                        altered_weights['fund_match'] = 0
-                    if 'Risk Appetitie' in attribute_criteria:
-                        altered_weights['risk_match'] = 100/len(attribute_criteria)
-                    else:
-                        altered_weights['risk_match'] = 0
-                score = self.calculate_match_score(investor, startup, altered_weights)
-                compatibility = (
-                    "High Compatibility"
-                    if score >= self.match_threshold
-                    else "Medium Compatibility"
-                    if score >= self.match_threshold * 0.75
-                    else "Low Compatibility"
-                )
-                matches.append({
-                    "Investor": investor.get('Investor_Group_Name', 'Unknown'),
-                    "Startup": startup.get('Company_Name', 'Unknown'),
-                    "Compatibility": compatibility,
-                    "Score": score
-                })
-
-        return pd.DataFrame(matches)
+        filtered_startups = self.startups
+        if value_criteria is not None:
+            for key, value in value_criteria.items():
+                # do only if the value is not empty
+                if value:
+                    if key == 'Growth Potential':
+                        if value == 'High':
+                            filtered_startups = filtered_startups[filtered_startups['Growth_Potential'] == 'High']
+                        elif value == 'Medium':
+                            filtered_startups = filtered_startups[filtered_startups['Growth_Potential'] == 'Medium']
+                        elif value == 'Low':
+                            filtered_startups = filtered_startups[filtered_startups['Growth_Potential'] == 'Low']
+                    elif key == 'ROI':
+                        filtered_startups = filtered_startups[filtered_startups['ROI'] >= float(value)]
+                    elif key == 'Investment Stage':
+                        filtered_startups = filtered_startups[filtered_startups['Investment_Stage'] == value]
+        startup_positions = self.startups.index.get_indexer(filtered_startups.index)
+        n_investors = len(self.investors)
+        if n_investors == 0 or len(startup_positions) == 0:
+            return pd.DataFrame()
+
+        altered_weights = self.weights
+        if attribute_criteria :
+            if 'Domain' in attribute_criteria:
+                altered_weights['domain_match'] = 100/len(attribute_criteria)
+            else:
+                altered_weights['domain_match'] = 0
+            if 'Fund Availability' in attribute_criteria:
+                altered_weights['fund_match'] = 100/len(attribute_criteria)
+            else:
+                altered_weights['fund_match'] = 0
+            if 'Risk Appetitie' in attribute_criteria:
+                altered_weights['risk_match'] = 100/len(attribute_criteria)
+            else:
+                altered_weights['risk_match'] = 0
+
+        # Score the whole investors x filtered startups block at once, in investor-major order
+        scores = self.component_scores()
+        domain_score, sector_score, fund_score, risk_score, score = weighted_scores(
+            *(scores[name][:, startup_positions] for name in self.score_components), altered_weights)
+        investor_names = np.repeat(self.investors['Investor_Group_Name'].to_numpy(), len(startup_positions))
+        startup_names = np.tile(self.startups['Company_Name'].to_numpy()[startup_positions], n_investors)
+        score = score.ravel()
+
+        new_rows = pd.DataFrame({
+            'Investor': investor_names,
+            'Startup': startup_names,
+            'Domain': domain_score.ravel(),
+            'Sector': sector_score.ravel(),
+            'Fund': fund_score.ravel(),
+            'Risk': risk_score.ravel()
+        })
+        self.toVisualize = pd.concat([self.toVisualize, new_rows], ignore_index=True)
+
+        return pd.DataFrame({
+            "Investor": investor_names,
+            "Startup": startup_names,
+            "Compatibility": self.compatibility_levels(score),
+            "Score": score
+        })
+
+    def build_investor_index(self):
+        """
+        Indexes used to prefilter investors for a single startup:
+        positions by Domain and Risk_Appetite, and Fund_Available sorted for range lookups
+        """
+        if self.investor_index is not None:
+            return self.investor_index
+        funds = np.asarray(self.encoded['fund_available'])
+        # Missing funds are left out of the sorted array, so they never fall in a tier and score 0
+        valid_funds = np.flatnonzero(~np.isnan(funds))
+        fund_order = valid_funds[np.argsort(funds[valid_funds], kind='stable')]
+        self.investor_index = {
+            "domain": {name: np.flatnonzero(self.investors['Domain'] == name)
+                       for name in self.investors['Domain'].dropna().unique()},
+            "risk": {name: np.flatnonzero(self.investors['Risk_Appetite'] == name)
+                     for name in self.investors['Risk_Appetite'].dropna().unique()},
+            "fund_order": fund_order,
+            "sorted_funds": funds[fund_order]
+        }
+        return self.investor_index
+
+    def fund_scores_for_deal(self, deal):
+        """
+        calculate_fund_match_score of every investor against one deal, using range lookups
+        on the sorted funds instead of comparing each investor
+        """
+        index = self.build_investor_index()
+        sorted_funds = index["sorted_funds"]
+        # Tier boundaries in ascending fund order; 'left' keeps ">=" bounds, 'right' keeps "<=" bounds
+        bounds = [
+            np.searchsorted(sorted_funds, deal * 0.5, side='left'),
+            np.searchsorted(sorted_funds, deal * 0.75, side='left'),
+            np.searchsorted(sorted_funds, deal, side='left'),
+            np.searchsorted(sorted_funds, deal * 1.5, side='right'),
+            np.searchsorted(sorted_funds, deal * 2, side='right'),
+            np.searchsorted(sorted_funds, deal * 3, side='right'),
+            len(sorted_funds)
+        ]
+        tier_scores = [25, 50, 100, 80, 60, 40]
+
+        fund_scores = np.zeros(len(self.investors), dtype=int)
+        for start, end, tier_score in zip(bounds[:-1], bounds[1:], tier_scores):
+            fund_scores[index["fund_order"][start:end]] = tier_score
+        return fund_scores
+
+    def find_matches_for_startup(self, startup_name, top_k=10, domains=None, risk_appetites=None,
+                                 min_fund_score=0, weights=None):
+        """
+        Score one startup against all investors and return the top_k matches.
+        Investors can be prefiltered by Domain, Risk_Appetite and a minimum fund match score.
+        """
+        if startup_name not in self.startup_positions:
+            raise KeyError(f"Unknown startup: {startup_name}")
+        startup_idx = self.startup_positions[startup_name]
+        weights = weights or self.weights
+        index = self.build_investor_index()
+
+        candidates = np.arange(len(self.investors))
+        if domains:
+            candidates = np.intersect1d(candidates, np.concatenate(
+                [index["domain"].get(name, np.array([], dtype=int)) for name in domains]))
+        if risk_appetites:
+            candidates = np.intersect1d(candidates, np.concatenate(
+                [index["risk"].get(name, np.array([], dtype=int)) for name in risk_appetites]))
+        fund = self.fund_scores_for_deal(self.encoded['deal'][startup_idx])[candidates]
+        if min_fund_score:
+            candidates = candidates[fund >= min_fund_score]
+            fund = fund[fund >= min_fund_score]
+
+        # Fetch the startup's column if the score matrices are available, otherwise compute it
+        if self.scores is not None:
+            domain = self.scores['domain'][candidates, startup_idx]
+            sector = self.scores['sector'][candidates, startup_idx]
+            risk = self.scores['risk'][candidates, startup_idx]
+        else:
+            investor_domain = self.encoded['investor_domain'][candidates]
+            domain = (investor_domain == self.encoded['startup_domain'][startup_idx]) & (investor_domain >= 0)
+            sector_counts = self.encoded['sector_counts'][startup_idx:startup_idx + 1]
+            sector = np.array([
+                sector_similarity(self.investor_portfolio_counts(i), sector_counts).max() * 100
+                for i in candidates
+            ], dtype=SECTOR_SCORE_DTYPE)
+            risk = self.risk_score_table()[self.encoded['investor_risk'][candidates],
+                                           self.encoded['startup_risk'][startup_idx]]
+
+        scores = weighted_scores(domain, sector, fund, risk, weights)[-1]
+
+        ranked = np.argsort(-scores, kind='stable')[:top_k]
+        return pd.DataFrame({
+            "Investor": self.investors['Investor_Group_Name'].to_numpy()[candidates[ranked]],
+            "Startup": startup_name,
+            "Compatibility": self.compatibility_levels(scores[ranked]),
+            "Score": scores[ranked]
+        })
+
+    def score_breakdown(self, investor_name, startup_name, weights=None):
+        """
+        Component scores, total score and the inputs behind them for one investor/startup pair
+        """
+        if investor_name not in self.investor_positions:
+            raise KeyError(f"Unknown investor: {investor_name}")
+        if startup_name not in self.startup_positions:
+            raise KeyError(f"Unknown startup: {startup_name}")
+        investor_idx = self.investor_positions[investor_name]
+        startup_idx = self.startup_positions[startup_name]
+        weights = weights or self.weights
+
+        investor_domain = self.investor_columns['Domain'][investor_idx]
+        startup_domain = self.startup_columns['Domain'][startup_idx]
+        fund_available = self.investor_columns['Fund_Available'][investor_idx]
+        deal = self.startup_columns['Deal'][startup_idx]
+        risk_appetite = self.investor_columns['Risk_Appetite'][investor_idx]
+        risk_assessment = self.startup_columns['Risk_Assessment'][startup_idx]
+
+        if self.scores is not None:
+            domain_match = bool(self.scores['domain'][investor_idx, startup_idx])
+            sector_score = float(self.scores['sector'][investor_idx, startup_idx])
+            best_entry = int(self.scores['sector_entry'][investor_idx, startup_idx])
+            fund_tier = int(self.scores['fund'][investor_idx, startup_idx])
+            risk_tier = int(self.scores['risk'][investor_idx, startup_idx])
+        else:
+            similarity = sector_similarity(
+                self.investor_portfolio_counts(investor_idx),
+                self.encoded['sector_counts'][startup_idx:startup_idx + 1]
+            )[0]
+            best_entry = int(similarity.argmax()) if similarity.max() > 0 else -1
+            # Same encodings and tables as component_scores, so both paths agree on missing values
+            investor_domain_code = self.encoded['investor_domain'][investor_idx]
+            domain_match = bool(investor_domain_code >= 0
+                                and investor_domain_code == self.encoded['startup_domain'][startup_idx])
+            # Rounded like the score matrix, so both paths give the same breakdown
+            sector_score = float(SECTOR_SCORE_DTYPE(similarity.max() * 100))
+            fund_tier = int(fund_match_scores(self.encoded['fund_available'][investor_idx],
+                                              self.encoded['deal'][startup_idx]))
+            risk_tier = int(self.risk_score_table()[self.encoded['investor_risk'][investor_idx],
+                                                    self.encoded['startup_risk'][startup_idx]])
+
+        domain_score = weights['domain_match'] if domain_match else 0
+        fund_score = (weights['fund_match'] * fund_tier) / 100
+        risk_score = (weights['risk_match'] * risk_tier) / 100
+        score = domain_score + sector_score + fund_score + risk_score
+        best_portfolio_match = None
+        if best_entry >= 0:
+            portfolio_start = int(self.encoded['portfolio_offsets'][investor_idx])
+            best_portfolio_match = self.encoded['portfolio_entries'][portfolio_start + best_entry].strip()
+
+        breakdown = {
+            "Investor": investor_name,
+            "Startup": startup_name,
+            "Domain": domain_score,
+            "Sector": sector_score,
+            "Fund": fund_score,
+            "Risk": risk_score,
+            "Score": score,
+            "Compatibility": self.compatibility_level(score),
+            "Investor_Domain": investor_domain,
+            "Startup_Domain": startup_domain,
+            "Best_Portfolio_Match": best_portfolio_match,
+            "Startup_Sector": self.startup_columns['Sector'][startup_idx],
+            "Fund_Available": fund_available,
+            "Deal": deal,
+            "Fund_Ratio": fund_available / deal if deal else float('inf'),
+            "Fund_Tier": fund_tier,
+            "Risk_Appetite": risk_appetite,
+            "Risk_Assessment": risk_assessment,
+            "Risk_Tier": risk_tier
+        }
+        # Values read from the column arrays are numpy scalars, return plain Python values
+        return {key: value.item() if isinstance(value, np.generic) else value for key, value in breakdown.items()}
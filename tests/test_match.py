@@ -0,0 +1,191 @@
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from match import InvestorMatcher
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INVESTORS_CSV = os.path.join(REPO_ROOT, "investors.csv")
+STARTUPS_CSV = os.path.join(REPO_ROOT, "startups.csv")
+
+# Sector scores are stored as float32, so they match the reference scorer to ~1e-6
+TOLERANCE = 1e-4
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """
+    Copies of the bundled CSVs that a test may modify
+    """
+    shutil.copy(INVESTORS_CSV, tmp_path / "investors.csv")
+    shutil.copy(STARTUPS_CSV, tmp_path / "startups.csv")
+    return tmp_path
+
+
+def make_matcher(directory, **kwargs):
+    return InvestorMatcher(
+        investors_file=str(directory / "investors.csv"),
+        startups_file=str(directory / "startups.csv"),
+        **kwargs
+    )
+
+
+def reference_scores(matcher):
+    """
+    calculate_match_score for every investor x startup pair
+    """
+    return np.array([
+        [matcher.calculate_match_score(investor, startup, matcher.weights)
+         for _, startup in matcher.startups.iterrows()]
+        for _, investor in matcher.investors.iterrows()
+    ])
+
+
+def startup_query_scores(matcher):
+    """
+    find_matches_for_startup scores for every investor x startup pair
+    """
+    scores = np.zeros((len(matcher.investors), len(matcher.startups)))
+    for startup_idx, startup_name in enumerate(matcher.startups['Company_Name']):
+        matches = matcher.find_matches_for_startup(startup_name, top_k=None)
+        by_investor = dict(zip(matches['Investor'], matches['Score']))
+        for investor_idx, investor_name in enumerate(matcher.investors['Investor_Group_Name']):
+            scores[investor_idx, startup_idx] = by_investor[investor_name]
+    return scores
+
+
+def breakdown_scores(matcher):
+    """
+    score_breakdown totals for every investor x startup pair
+    """
+    return np.array([
+        [matcher.score_breakdown(investor_name, startup_name)['Score']
+         for startup_name in matcher.startups['Company_Name']]
+        for investor_name in matcher.investors['Investor_Group_Name']
+    ])
+
+
+def assert_matches_reference(matcher):
+    reference = reference_scores(matcher)
+
+    # Before the score matrices exist, the single-startup and single-pair queries compute from the encodings
+    assert matcher.scores is None
+    np.testing.assert_allclose(startup_query_scores(matcher), reference, atol=TOLERANCE)
+    np.testing.assert_allclose(breakdown_scores(matcher), reference, atol=TOLERANCE)
+
+    precomputed = np.array([
+        [matcher.precomputed_match_score(i, j, matcher.weights)[0] for j in range(len(matcher.startups))]
+        for i in range(len(matcher.investors))
+    ])
+    np.testing.assert_allclose(precomputed, reference, atol=TOLERANCE)
+
+    # With the matrices built, the same queries fetch from them
+    np.testing.assert_allclose(startup_query_scores(matcher), reference, atol=TOLERANCE)
+    np.testing.assert_allclose(breakdown_scores(matcher), reference, atol=TOLERANCE)
+    results = matcher.find_matches()
+    np.testing.assert_allclose(results['Score'].to_numpy(), reference.ravel(), atol=TOLERANCE)
+
+
+def test_scores_match_reference_scorer():
+    matcher = InvestorMatcher(investors_file=INVESTORS_CSV, startups_file=STARTUPS_CSV)
+    assert_matches_reference(matcher)
+
+
+def test_missing_values_match_reference_scorer(data_dir):
+    investors = pd.read_csv(data_dir / "investors.csv")
+    startups = pd.read_csv(data_dir / "startups.csv")
+    investors.loc[0, 'Risk_Appetite'] = None
+    investors.loc[1, 'Fund_Available'] = None
+    investors.loc[2, 'Domain'] = None
+    startups.loc[0, 'Risk_Assessment'] = None
+    startups.loc[1, 'Domain'] = None
+    investors.to_csv(data_dir / "investors.csv", index=False)
+    startups.to_csv(data_dir / "startups.csv", index=False)
+
+    assert_matches_reference(make_matcher(data_dir))
+
+
+def test_find_matches_applies_attribute_weights():
+    matcher = InvestorMatcher(investors_file=INVESTORS_CSV, startups_file=STARTUPS_CSV)
+    results = matcher.find_matches(attribute_criteria=['Domain', 'Risk Appetitie'])
+
+    assert matcher.weights['domain_match'] == 50
+    assert matcher.weights['fund_match'] == 0
+    np.testing.assert_allclose(results['Score'].to_numpy(), reference_scores(matcher).ravel(), atol=TOLERANCE)
+    assert len(matcher.toVisualize) == len(results)
+
+
+def test_snapshot_round_trip(data_dir):
+    snapshot_dir = data_dir / "snapshot"
+    cold = make_matcher(data_dir, snapshot_dir=str(snapshot_dir))
+    cold_results = cold.find_matches()
+    assert (snapshot_dir / "manifest.json").exists()
+
+    warm = make_matcher(data_dir, snapshot_dir=str(snapshot_dir))
+    assert isinstance(warm.encoded['deal'], np.memmap)
+    assert isinstance(warm.scores['sector'], np.memmap)
+    pd.testing.assert_frame_equal(warm.find_matches(), cold_results)
+
+
+def test_snapshot_without_scores(data_dir):
+    snapshot_dir = data_dir / "snapshot"
+    make_matcher(data_dir, snapshot_dir=str(snapshot_dir), snapshot_scores=False)
+
+    warm = make_matcher(data_dir, snapshot_dir=str(snapshot_dir))
+    assert isinstance(warm.encoded['deal'], np.memmap)
+    assert warm.scores is None
+
+
+def test_stale_snapshot_is_rebuilt(data_dir):
+    snapshot_dir = data_dir / "snapshot"
+    make_matcher(data_dir, snapshot_dir=str(snapshot_dir))
+
+    startups = pd.read_csv(data_dir / "startups.csv")
+    extra = startups.iloc[[0]].assign(Company_Name="Added Startup")
+    pd.concat([startups, extra], ignore_index=True).to_csv(data_dir / "startups.csv", index=False)
+
+    rebuilt = make_matcher(data_dir, snapshot_dir=str(snapshot_dir))
+    assert not isinstance(rebuilt.encoded['deal'], np.memmap)
+    assert rebuilt.component_scores()['sector'].shape == (len(rebuilt.investors), len(startups) + 1)
+
+    warm = make_matcher(data_dir, snapshot_dir=str(snapshot_dir))
+    assert isinstance(warm.encoded['deal'], np.memmap)
+    assert warm.scores['sector'].shape == (len(warm.investors), len(startups) + 1)
+
+
+def test_snapshot_with_mismatched_shapes_is_rebuilt(data_dir):
+    snapshot_dir = data_dir / "snapshot"
+    make_matcher(data_dir, snapshot_dir=str(snapshot_dir))
+    np.save(snapshot_dir / "score_fund.npy", np.zeros((3, 3), dtype=np.uint8))
+
+    rebuilt = make_matcher(data_dir, snapshot_dir=str(snapshot_dir))
+    assert not isinstance(rebuilt.encoded['deal'], np.memmap)
+
+    warm = make_matcher(data_dir, snapshot_dir=str(snapshot_dir))
+    assert warm.scores['fund'].shape == (len(warm.investors), len(warm.startups))
+
+
+def test_unwritable_snapshot_dir_does_not_break_matcher(data_dir):
+    blocker = data_dir / "not_a_directory"
+    blocker.write_text("")
+
+    matcher = make_matcher(data_dir, snapshot_dir=str(blocker / "snapshot"))
+    assert len(matcher.find_matches()) == len(matcher.investors) * len(matcher.startups)
+
+
+def test_score_breakdown_is_the_same_with_and_without_score_matrices():
+    matcher = InvestorMatcher(investors_file=INVESTORS_CSV, startups_file=STARTUPS_CSV)
+    pairs = [(investor_name, startup_name)
+             for investor_name in matcher.investors['Investor_Group_Name']
+             for startup_name in matcher.startups['Company_Name']]
+    computed = [matcher.score_breakdown(*pair) for pair in pairs]
+    matcher.component_scores()
+    fetched = [matcher.score_breakdown(*pair) for pair in pairs]
+
+    assert computed == fetched
+    assert any(breakdown['Best_Portfolio_Match'] for breakdown in fetched)
+    for value in fetched[0].values():
+        assert not isinstance(value, np.generic)